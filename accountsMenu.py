@@ -17,6 +17,7 @@ class AccountsMenu(Menu):
     """
     Handle the account menu.
     """
+    __slots__ = ()
     def __init__(self,
                  std_screen: curses.window,
                  top_left: tuple[int, int],
@@ -31,7 +32,7 @@ class AccountsMenu(Menu):
         """
 
         # Determine size:
-        size = calc_size(STRINGS['acctMenuNames'].values())
+        size = calc_size(tuple(STRINGS['acctMenuNames'].values()))
 
         window = curses.newwin(size[HEIGHT], size[WIDTH], top_left[ROW], top_left[COL])
 
@@ -16,6 +16,8 @@ class Bar(object):
     """
     Base class for the status and menu bars.
     """
+    __slots__ = ('_std_screen', '_bg_attrs', '_bg_char', '_is_visible', '_window', '_is_focused', 'focus_id',
+                 'real_top_left', 'top_left', 'real_size', 'size', 'real_bottom_right', 'bottom_right')
     def __init__(self,
                  std_screen: curses.window,
                  top: int,
@@ -76,9 +78,8 @@ class Bar(object):
             return
         _, num_cols = self._window.getmaxyx()
         # logger.debug("num_rows: %i, num_cols %i" % (num_rows, num_cols))
-        for col in range(0, num_cols - 1):
-            # logger.debug("col = %i : max_col: %i" % (col, (self.width-1)))
-            self._window.addstr(0, col, self._bg_char, self._bg_attrs)
+        # Fill all but the last column in one call, writing the last column causes an exception:
+        self._window.addstr(0, 0, self._bg_char * (num_cols - 1), self._bg_attrs)
         try:
             self._window.addstr(0, num_cols - 1, self._bg_char, self._bg_attrs)
         except curses.error:
@@ -186,11 +187,11 @@ class Bar(object):
         """
         if not isinstance(value, bool):
             __type_error__('value', 'bool', value)
-        old_value: bool = self._is_focused
+        if value == self._is_focused:
+            return
         self._is_focused = value
-        if value != old_value:
-            self.redraw()
-            self.__is_focused_hook__(False, value)
+        self.redraw()
+        self.__is_focused_hook__(False, value)
         return
 
     @property
@@ -4,6 +4,7 @@ File: common.py
 -> Store common constants variables, Enums, etc.
 """
 import playsound
+import curses
 import datetime
 import logging
 import os
@@ -167,16 +168,23 @@ SIGNAL_LOG_FILE_NAME: Final[str] = 'signal-cli.log'
 """Name of the signal-cli log file."""
 CLI_SIGNAL_LOG_FILE_NAME: Final[str] = 'cliSignal.log'
 """Name of the cliSignal log file."""
-WORKING_DIR: Final[str] = os.path.join(os.environ.get("HOME"), WORKING_DIR_NAME)
+try:
+    HOME_DIR: Final[str] = os.environ["HOME"]
+    """The users' home directory."""
+except KeyError:
+    raise RuntimeError("$HOME is not set, unable to determine the working directory.") from None
+WORKING_DIR: Final[str] = f"{HOME_DIR}/{WORKING_DIR_NAME}"
 """The full path to the working directory."""
-SIGNAL_LOG_PATH: Final[str] = os.path.join(WORKING_DIR, SIGNAL_LOG_FILE_NAME)
+SIGNAL_LOG_PATH: Final[str] = f"{WORKING_DIR}/{SIGNAL_LOG_FILE_NAME}"
 """The full path to the log file."""
-SIGNAL_CONFIG_DIR: Final[str] = os.path.join(WORKING_DIR, SIGNAL_CONFIG_DIR_NAME)
+SIGNAL_CONFIG_DIR: Final[str] = f"{WORKING_DIR}/{SIGNAL_CONFIG_DIR_NAME}"
 """The full path to the default signal-cli config directory."""
-CLI_SIGNAL_CONFIG_FILE_PATH: Final[str] = os.path.join(WORKING_DIR, CONFIG_FILE_NAME)
+CLI_SIGNAL_CONFIG_FILE_PATH: Final[str] = f"{WORKING_DIR}/{CONFIG_FILE_NAME}"
 """The full path to the cliSignal config file."""
-CLI_SIGNAL_LOG_PATH: Final[str] = os.path.join(WORKING_DIR, CLI_SIGNAL_LOG_FILE_NAME)
+CLI_SIGNAL_LOG_PATH: Final[str] = f"{WORKING_DIR}/{CLI_SIGNAL_LOG_FILE_NAME}"
 """The full path to the cliSignal log file."""
+LOG_BUFFER_CAPACITY: Final[int] = 256
+"""The number of log records to buffer before writing them to the log file."""
 HOST_NAME: Final[str] = socket.gethostname().split('.')[0]
 """The host name of the computer running cliSignal."""
 DEVICE_NAME: Final[str] = HOST_NAME + '-cliSignal'
@@ -186,8 +194,8 @@ DEVICE_NAME: Final[str] = HOST_NAME + '-cliSignal'
 #####################################
 KEY_ESC: Final[int] = 27
 """Escape key code."""
-KEYS_ENTER: Final[tuple[int, int]] = (10, 77)
-"""Main enter and keypad enter key codes."""
+KEYS_ENTER: Final[frozenset[int]] = frozenset((ord('\n'), ord('\r'), curses.KEY_ENTER))
+"""Main enter, carriage return and keypad enter key codes."""
 KEY_TAB: Final[int] = ord('\t')
 """TAB key code."""
 KEY_SHIFT_TAB: Final[int] = 353
@@ -350,6 +358,8 @@ DEBUG: bool = False
 """True if we should produce debug output."""
 VERBOSE: bool = False
 """True if we should produce verbose output."""
+OUT_ENABLED: bool = False
+"""True if out_info() should print to stdout, set once after the command line is parsed."""
 RESIZING: bool = False
 """True if we are currently resizing the window."""
 
@@ -357,6 +367,8 @@ MOUSE_RESET_MASK: Optional[int] = None
 """The reset mouse mask."""
 SIGNAL_LINK_THREAD: Optional[SignalLinkThread] = None
 """The signal link thread."""
+LINK_FOCUS: Optional[Focus] = None
+"""The link or qr-code window to show and focus, set by the link thread and applied by the main loop."""
 RECEIVE_STARTED: bool = False
 """Has receive started?"""
 IS_CURSES_STARTED: bool = False
@@ -407,11 +419,10 @@ def out_info(message: str, force=False) -> None:
     """
     Output an info message to both the log file if logging started, and stdout if curses not started.
     :param message: The message to output
-    :param force: Override _VERBOSE
+    :param force: Override OUT_ENABLED.
     :return: None
     """
-    global IS_CURSES_STARTED, LOGGER
-    if not IS_CURSES_STARTED:
+    if not IS_CURSES_STARTED and (OUT_ENABLED or force):
         print_info(message, force=True)
     if LOGGER is not None:
         LOGGER.info(message)
@@ -424,7 +435,6 @@ def out_error(message) -> None:
     :param message: The message to output.
     :return: None
     """
-    global IS_CURSES_STARTED, LOGGER
     if not IS_CURSES_STARTED:
         print_error(message)
     if LOGGER is not None:
@@ -438,7 +448,6 @@ def out_debug(message) -> None:
     :param message: The message to output.
     :return: None
     """
-    global IS_CURSES_STARTED, LOGGER
     if not IS_CURSES_STARTED:
         print_debug(message)
     if LOGGER is not None:
@@ -452,7 +461,6 @@ def out_warning(message) -> None:
     :param message: The message to output.
     :return: None
     """
-    global IS_CURSES_STARTED, LOGGER
     if not IS_CURSES_STARTED:
         print_warning(message)
     if LOGGER is not None:
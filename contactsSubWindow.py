@@ -13,7 +13,7 @@ from SignalCliApi import SignalContacts, SignalContact
 from SignalCliApi.signalCommon import UNKNOWN_CONTACT_NAME
 from common import HEIGHT, TOP, LEFT, WIDTH, STRINGS, ContactsFocus, RIGHT, BOTTOM
 from contactItem import ContactItem
-from cursesFunctions import calc_attributes, terminal_bell, add_str, add_ch, get_rel_mouse_pos
+from cursesFunctions import calc_attributes, terminal_bell, add_str, get_rel_mouse_pos
 from horizontalScrollBar import HorizontalScrollBar
 from themes import ThemeColours
 from typeError import __type_error__
@@ -152,9 +152,9 @@ class ContactsSubWindow(Window):
         logger: logging.Logger = logging.getLogger(__name__ + '.' + self.__clear_pad__.__name__)
         logger.debug("BG CHAR: '%s'" % self._bg_char)
         num_rows, num_cols = pad.getmaxyx()
+        bg_line: str = self._bg_char * num_cols
         for row in range(0, num_rows):
-            for col in range(0, num_cols):
-                add_ch(pad, self._bg_char, self._bg_attrs, row, col)
+            add_str(pad, bg_line, self._bg_attrs, row, 0)
         return
 
     def __generate_empty_pad__(self, size: tuple[int, int]):  # Return Type: _CursesWindow.
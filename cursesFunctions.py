@@ -11,6 +11,16 @@ from common import HEIGHT, WIDTH, ROW, COL, _ACCEL_INDICATOR, BUTTON_SCROLL_UP,
 
 CURSOR_POS: tuple[int, int] = (0, 0)
 """The current known cursor position."""
+_ATTRIBUTES_CACHE: dict[tuple[int, bool, bool, bool], int] = {}
+"""Calculated attributes, keyed by: (colour_pair, bold, underline, reverse)."""
+_ACCEL_TEXT_CACHE: dict[str, tuple[tuple[str, bool], ...]] = {}
+"""Accelerator text split into (text, is_accel) runs, keyed by the text with accelerator indicators."""
+_LEFT_CLICK_MASK: int = curses.BUTTON1_CLICKED | curses.BUTTON1_PRESSED
+"""Button state bits counted as a left click."""
+_MIDDLE_CLICK_MASK: int = curses.BUTTON2_CLICKED | curses.BUTTON2_PRESSED
+"""Button state bits counted as a middle click."""
+_RIGHT_CLICK_MASK: int = curses.BUTTON3_CLICKED | curses.BUTTON3_PRESSED
+"""Button state bits counted as a right click."""
 
 
 #########################################
@@ -23,13 +33,20 @@ def calc_attributes(colour_pair: int, attrs: dict[str, int | bool]) -> int:
     :param attrs: The attrs dict.
     :return: int: The attributes int.
     """
+    key: tuple[int, bool, bool, bool] = (colour_pair, bool(attrs['bold']), bool(attrs['underline']),
+                                         bool(attrs['reverse']))
+    try:
+        return _ATTRIBUTES_CACHE[key]
+    except KeyError:
+        pass
     attributes: int = curses.color_pair(colour_pair)
-    if attrs['bold']:
+    if key[1]:
         attributes |= curses.A_BOLD
-    if attrs['underline']:
+    if key[2]:
         attributes |= curses.A_UNDERLINE
-    if attrs['reverse']:
+    if key[3]:
         attributes |= curses.A_REVERSE
+    _ATTRIBUTES_CACHE[key] = attributes
     return attributes
 
 
@@ -271,27 +288,17 @@ def draw_border_on_win(window,  # Type: curses.window | curses._CursesWindow
     bottom: int = top + height - 1
     right: int = left + width - 1
 
-    # Top and bottom sides:
-    for col in range(left + 1, right):
-        add_ch(window, ts, border_attrs, top, col)
-        add_ch(window, bs, border_attrs, bottom, col)
+    # Top side and corners as a single string:
+    side_width: int = width - 2
+    add_str(window, tl + ts * side_width + tr, border_attrs, top, left)
 
     # Left and right sides:
     for row in range(top + 1, bottom):
         add_ch(window, ls, border_attrs, row, left)
         add_ch(window, rs, border_attrs, row, right)
 
-    # Top left corner:
-    add_ch(window, tl, border_attrs, top, left)
-
-    # Top right corner:
-    add_ch(window, tr, border_attrs, top, right)
-
-    # Bottom left corner:
-    add_ch(window, bl, border_attrs, bottom, left)
-
-    # Bottom right corner, causes exception:
-    add_ch(window, br, border_attrs, bottom, right)
+    # Bottom side and corners as a single string, the bottom right corner causes an exception add_str() ignores:
+    add_str(window, bl + bs * side_width + br, border_attrs, bottom, left)
     return
 
 
@@ -387,15 +394,17 @@ def add_accel_text(window: curses.window,
     :param accel_attrs: int: The attributes for the accelerator text.
     :return: None
     """
-    is_accel: bool = False
-    for character in accel_text:
-        if character == _ACCEL_INDICATOR:
-            is_accel = not is_accel
+    try:
+        runs: tuple[tuple[str, bool], ...] = _ACCEL_TEXT_CACHE[accel_text]
+    except KeyError:
+        # Every accelerator indicator toggles accelerator text, so odd parts are accelerator text:
+        runs = tuple((text, bool(i % 2)) for i, text in enumerate(accel_text.split(_ACCEL_INDICATOR)) if text)
+        _ACCEL_TEXT_CACHE[accel_text] = runs
+    for text, is_accel in runs:
+        if is_accel:
+            window.addstr(text, accel_attrs)
         else:
-            if is_accel:
-                window.addstr(character, accel_attrs)
-            else:
-                window.addstr(character, normal_attrs)
+            window.addstr(text, normal_attrs)
     return
 
 
@@ -475,9 +484,7 @@ def get_left_click(button_state: int) -> bool:
     :param button_state: int: The current button state.
     :return: bool: True if the left button was clicked, False, it was not.
     """
-    if (button_state & curses.BUTTON1_CLICKED != 0) or (button_state & curses.BUTTON1_PRESSED != 0):
-        return True
-    return False
+    return button_state & _LEFT_CLICK_MASK != 0
 
 
 def get_left_double_click(button_state: int) -> bool:
@@ -497,9 +504,7 @@ def get_middle_click(button_state: int) -> bool:
     :param button_state: int: The current button state.
     :return: bool: True the middle button was clicked, False it was not.
     """
-    if (button_state & curses.BUTTON2_CLICKED != 0) or (button_state & curses.BUTTON2_PRESSED != 0):
-        return True
-    return False
+    return button_state & _MIDDLE_CLICK_MASK != 0
 
 
 def get_middle_double_click(button_state: int) -> bool:
@@ -519,9 +524,7 @@ def get_right_click(button_state: int) -> bool:
     :param button_state: int: The current button state.
     :return:
     """
-    if (button_state & curses.BUTTON3_CLICKED != 0) or (button_state & curses.BUTTON3_PRESSED != 0):
-        return True
-    return False
+    return button_state & _RIGHT_CLICK_MASK != 0
 
 
 def get_right_double_click(button_state: int) -> bool:
@@ -18,6 +18,7 @@ class FileMenu(Menu):
     """
     Handle the file menu.
     """
+    __slots__ = ()
 ###############################################
 # Initialize:
 ###############################################
@@ -36,7 +37,7 @@ class FileMenu(Menu):
         """
 
         # Determine size and create a window:
-        size: tuple[int, int] = calc_size(STRINGS['fileMenuNames'].values())
+        size: tuple[int, int] = calc_size(tuple(STRINGS['fileMenuNames'].values()))
         window = curses.newwin(size[HEIGHT], size[WIDTH], top_left[ROW], top_left[COL])
         # Create menu Items:
         settings_menu_item: MenuItem = MenuItem(std_screen=std_screen,
@@ -13,7 +13,7 @@ import common
 from SignalCliApi import SignalGroup
 from SignalCliApi.signalGroups import SignalGroups
 from common import HEIGHT, WIDTH, TOP, LEFT, STRINGS, ContactsFocus, RIGHT, BOTTOM
-from cursesFunctions import calc_attributes, add_ch, terminal_bell
+from cursesFunctions import calc_attributes, add_str, terminal_bell
 from groupItem import GroupItem
 from horizontalScrollBar import HorizontalScrollBar
 from themes import ThemeColours
@@ -154,9 +154,9 @@ class GroupsSubWindow(Window):
 
     def __clear_pad__(self, pad) -> None:
         num_rows, num_cols = pad.getmaxyx()
+        bg_line: str = self._bg_char * num_cols
         for row in range(0, num_rows):
-            for col in range(0, num_cols):
-                add_ch(pad, self._bg_char, self._bg_attrs, row, col)
+            add_str(pad, bg_line, self._bg_attrs, row, 0)
         return
 
     def __generate_empty_pad__(self, size: tuple[int, int]):  # Return Type: _CursesWindow
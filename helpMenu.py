@@ -17,6 +17,7 @@ class HelpMenu(Menu):
     """
     Handle the help menu.
     """
+    __slots__ = ()
     def __init__(self,
                  std_screen: curses.window,
                  top_left: tuple[int, int],
@@ -30,7 +31,7 @@ class HelpMenu(Menu):
         :param theme: dict[str, dict[str, int | bool | str]: The current theme in use.
         """
         # Determine size:
-        size: tuple[int, int] = calc_size(STRINGS['helpMenuNames'].values())
+        size: tuple[int, int] = calc_size(tuple(STRINGS['helpMenuNames'].values()))
         window = curses.newwin(size[HEIGHT], size[WIDTH], top_left[ROW], top_left[COL])
         # Build the menu items:
         shortcut_label: str = STRINGS['helpMenuNames']['shortcuts']
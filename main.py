@@ -2,11 +2,14 @@
 """
 File: main.py
 """
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Final
 import argparse
 import os.path
+import stat
+import sys
 import curses
 import logging
+import logging.handlers
 
 import prettyPrint
 from SignalCliApi import SignalSyncMessage, SignalContacts, SignalTypingMessage
@@ -42,6 +45,9 @@ runCallback.set_suppress_error(True)  # Supress errors calling callbacks.
 typeError.set_use_syslog(False)  # Dont' log to syslog.
 typeError.set_use_logging(True)  # Use Logging.
 
+_VALID_THEMES: Final[frozenset[str]] = frozenset(('light', 'dark', 'custom'))
+"""The valid values for the theme setting."""
+
 
 #########################################
 # My menu callbacks:
@@ -65,6 +71,7 @@ def file_menu_quit_cb(status: str, std_screen: curses.window) -> None:
     common.MAIN_WINDOW.hide_sub_windows()
     common.MAIN_WINDOW.quit_window.is_visible = True
     set_current_focus(Focus.QUIT)
+    common.MAIN_WINDOW.is_dirty = True
     return
 
 
@@ -100,7 +107,7 @@ def accounts_menu_link_cb(status: str,
     link_window.is_visible = True
     set_current_focus(Focus.LINK)
     # Redraw:
-    common.MAIN_WINDOW.redraw()
+    common.MAIN_WINDOW.is_dirty = True
     # Start the link thread.
     signal_cli.start_link_thread(
         callback=(signal_link_cb, [signal_cli]),
@@ -149,6 +156,25 @@ def help_menu_version_cb(status: str, std_screen: curses.window, *args: tuple[An
     return
 
 
+_MENU_CALLBACKS: Final[dict[str, dict[str, tuple[Optional[Callable], Optional[list[Any]]]]]] = {
+    'file': {
+        'settings': (file_menu_settings_cb, None),
+        'quit': (file_menu_quit_cb, None),
+    },
+    'accounts': {
+        'switch': (accounts_menu_switch_cb, None),
+        'link': (accounts_menu_link_cb, None),
+        'register': (accounts_menu_register_cb, None),
+    },
+    'help': {
+        'shortcuts': (help_menu_shortcuts_cb, None),
+        'about': (help_menu_about_cb, None),
+        'version': (help_menu_version_cb, None),
+    },
+}
+"""The static menu callbacks, any runtime parameters are filled in by main()."""
+
+
 #########################################
 # Button callbacks:
 #########################################
@@ -163,8 +189,11 @@ def signal_start_up_cb(state: str) -> None:
     :param state: str, the current state of the startup process.
     :return: None
     """
-    # global _VERBOSE
-    if common.VERBOSE:
+    # Printing once curses is started would corrupt the screen, so just log it:
+    if common.IS_CURSES_STARTED:
+        logger: logging.Logger = logging.getLogger(__name__ + '.' + signal_start_up_cb.__name__)
+        logger.info("SIGNAL: %s", state)
+    elif common.VERBOSE:
         print_coloured("SIGNAL:", fg_colour=Colours.FG.blue, bold=True, end='')
         print(state)
     return
@@ -176,6 +205,7 @@ def signal_link_cb(state: str,
                    ) -> bool:
     """
     Link account signal callback.
+    NOTE: This runs on the link thread, so it only sets state; the main loop shows, focuses and draws the windows.
     :param state: str: The current state.
     :param data: Optional[tuple[Optional[str], Optional[str]] | str | SignalAccount]:
     :param signal_cli: SignalCli: The signal_cli object.
@@ -189,11 +219,9 @@ def signal_link_cb(state: str,
     link_window: LinkWindow = common.MAIN_WINDOW.link_window
     qr_window: QRCodeWindow = common.MAIN_WINDOW.qr_window
     if state == LinkAccountCallbackStates.GENERATE_QR_STOP.value:
-        link_window.is_visible = False
         qr_window.qrcode = data[0].splitlines(keepends=False)
-        qr_window.is_visible = True
-        set_current_focus(Focus.QR_CODE)
-        common.MAIN_WINDOW.redraw()
+        common.LINK_FOCUS = Focus.QR_CODE
+        common.MAIN_WINDOW.is_dirty = True
         return False
     elif state == LinkAccountCallbackStates.LINK_SUCCESS.value:
         link_window.current_message = LinkMessages.SUCCESS
@@ -209,11 +237,9 @@ def signal_link_cb(state: str,
         link_window.current_message = LinkMessages.TIMEOUT
     else:
         return False
-    qr_window.is_visible = False
     link_window.show_button = True
-    link_window.is_visible = True
-    set_current_focus(Focus.LINK)
-    common.MAIN_WINDOW.redraw()
+    common.LINK_FOCUS = Focus.LINK
+    common.MAIN_WINDOW.is_dirty = True
     signal_cli.stop_link_thread()
     return False
 
@@ -236,6 +262,7 @@ def signal_received_message_cb(account: SignalAccount, message: SignalReceivedMe
         groups_sub_window.update()
     elif message.recipient.recipient_type == RecipientTypes.CONTACT:
         contacts_sub_window.update()
+    main_window.is_dirty = True
     return
 
 
@@ -244,6 +271,7 @@ def signal_receipt_message_cb(account: SignalAccount, receipt: SignalReceipt):
     messages_window: MessagesWindow = common.MAIN_WINDOW.messages_window
     if receipt.sender == common.CURRENT_RECIPIENT:
         messages_window.update()
+        common.MAIN_WINDOW.is_dirty = True
     return
 
 
@@ -257,6 +285,7 @@ def signal_sync_message_cb(account: SignalAccount, sync_message: SignalSyncMessa
         common.MAIN_WINDOW.contacts_window.contacts_win.update()
     elif sync_message.sync_type == SyncTypes.GROUPS:
         common.MAIN_WINDOW.contacts_window.groups_win.update()
+    common.MAIN_WINDOW.is_dirty = True
     return
 
 
@@ -277,6 +306,7 @@ def signal_reaction_message_cb(account: SignalAccount, message: SignalReaction):
     if common.CURRENT_RECIPIENT is not None:
         if message.recipient == common.CURRENT_RECIPIENT or message.sender == common.CURRENT_RECIPIENT:
             common.MAIN_WINDOW.messages_window.message_received()
+            common.MAIN_WINDOW.is_dirty = True
     return
 
 
@@ -446,6 +476,24 @@ def __preprocess_key__(char_code: int) -> Optional[bool]:
     return None
 
 
+_MOUSE_REPORT_ON: Final[bytes] = b'\x1b[?1003h'
+"""Terminal control sequence to start reporting mouse movement."""
+_MOUSE_REPORT_OFF: Final[bytes] = b'\x1b[?1003l'
+"""Terminal control sequence to stop reporting mouse movement."""
+
+
+def __write_terminal__(control: bytes) -> None:
+    """
+    Write a terminal control sequence straight to the stdout buffer, bypassing the text layer.
+    :param control: bytes: The control sequence to write.
+    :return: None
+    """
+    sys.stdout.flush()
+    sys.stdout.buffer.write(control)
+    sys.stdout.buffer.flush()
+    return
+
+
 def __stop_mouse__() -> None:
     """
     Stop the mouse support:
@@ -460,7 +508,7 @@ def __stop_mouse__() -> None:
         curses.mousemask(common.MOUSE_RESET_MASK)
     # Tell the terminal to stop processing mouse movements:
     out_debug("Sending terminal stop report characters.")
-    print('\033[?1003l', end='', flush=True)
+    __write_terminal__(_MOUSE_REPORT_OFF)
     return
 
 
@@ -484,7 +532,7 @@ def __start_mouse__() -> bool:
         common.MOUSE_RESET_MASK = response[1]
     # Tell the terminal to report mouse movement.
     out_debug("Sending terminal control characters...")
-    print('\033[?1003h', end='', flush=True)
+    __write_terminal__(_MOUSE_REPORT_ON)
     return True
 
 
@@ -520,23 +568,11 @@ def main(std_screen: curses.window, signal_cli: SignalCli) -> None:
         if not __start_mouse__():
             common.SETTINGS['useMouse'] = False
 
-    # Create the callback dict:
+    # Create the callback dict, filling in the runtime parameters:
     callbacks: dict[str, dict[str, tuple[Optional[Callable], Optional[list[Any]]]]] = {
-        'file': {
-            'settings': (file_menu_settings_cb, None),
-            'quit': (file_menu_quit_cb, None),
-        },
-        'accounts': {
-            'switch': (accounts_menu_switch_cb, None),
-            'link': (accounts_menu_link_cb, [signal_cli]),
-            'register': (accounts_menu_register_cb, None),
-        },
-        'help': {
-            'shortcuts': (help_menu_shortcuts_cb, None),
-            'about': (help_menu_about_cb, None),
-            'version': (help_menu_version_cb, None),
-        },
+        menu_name: dict(menu_callbacks) for menu_name, menu_callbacks in _MENU_CALLBACKS.items()
     }
+    callbacks['accounts']['link'] = (accounts_menu_link_cb, [signal_cli])
 
     # Create the main windows:
     main_window = MainWindow(
@@ -555,8 +591,9 @@ def main(std_screen: curses.window, signal_cli: SignalCli) -> None:
     # Call set_current_focus for the first time:
     set_current_focus(Focus.CONTACTS)
     main_window.contacts_window.is_focused = True
-    # Set visible status items:
-    if common.DEBUG:
+    # Set visible status items, the status bar only shows the char code in debug mode:
+    show_char_code: bool = common.DEBUG
+    if show_char_code:
         main_window.status_bar.is_char_code_visible = True
         if common.SETTINGS['useMouse']:
             main_window.status_bar.is_mouse_visible = True
@@ -574,11 +611,26 @@ def main(std_screen: curses.window, signal_cli: SignalCli) -> None:
                     if common.CURRENT_ACCOUNT_CHANGED:
                         main_window.contacts_window.account_changed()
                         common.CURRENT_ACCOUNT_CHANGED = False
+                        main_window.is_dirty = True
+
+                    # If the link thread asked for the link or qr-code window, show and focus it.
+                    link_focus: Optional[Focus] = common.LINK_FOCUS
+                    if link_focus is not None:
+                        common.LINK_FOCUS = None
+                        if link_focus == Focus.QR_CODE:
+                            main_window.link_window.is_visible = False
+                            main_window.qr_window.is_visible = True
+                        else:
+                            main_window.qr_window.is_visible = False
+                            main_window.link_window.is_visible = True
+                        set_current_focus(link_focus)
+                        main_window.is_dirty = True
 
                     # If the recipient has changed, change the recipient in the messages window.
                     if common.CURRENT_RECIPIENT_CHANGED:
                         main_window.messages_window.recipient_changed()
                         common.CURRENT_RECIPIENT_CHANGED = False
+                        main_window.is_dirty = True
 
                     # Get the character and update the status bar if required.
                     char_code: int = std_screen.getch()
@@ -586,9 +638,12 @@ def main(std_screen: curses.window, signal_cli: SignalCli) -> None:
                     # If no char, continue:
                     if char_code == -1:
                         continue
+                    # Any key or mouse event may change what is drawn:
+                    main_window.is_dirty = True
 
                     # Update the character code on the status bar:
-                    common.CHAR_CODE = char_code
+                    if show_char_code:
+                        common.CHAR_CODE = char_code
 
                     # Pre-process char code, catches mouse, and resize events:
                     char_handled = __preprocess_key__(char_code)
@@ -720,7 +775,7 @@ if __name__ == '__main__':
             exit(2)
 
     # Check working directory permissions, and if they are wrong, abort.
-    if oct(os.stat(common.WORKING_DIR).st_mode)[-3:] != oct(0o700)[-3:]:
+    if stat.S_IMODE(os.stat(common.WORKING_DIR).st_mode) != 0o700:
         out_error("Working directory: '%s', permissions are not 700." % common.WORKING_DIR)
         exit(3)
     common.SETTINGS['workingDir'] = common.WORKING_DIR
@@ -746,11 +801,20 @@ if __name__ == '__main__':
         common.VERBOSE = True
         prettyPrint.VERBOSE = True
         common.LOG_LEVEL = logging.INFO
+    common.OUT_ENABLED = common.VERBOSE
 
     # Set logging path:
     common.SETTINGS['logPath'] = common.CLI_SIGNAL_LOG_PATH
-    logging.basicConfig(filename=common.CLI_SIGNAL_LOG_PATH, encoding='utf-8', level=common.LOG_LEVEL,
-                        format='%(levelname)s : [%(asctime)s] : (%(name)s) : %(message)s')
+    # Buffer log records in memory, only writing the file when the buffer fills, or a warning or worse is logged:
+    _log_file_handler: logging.FileHandler = logging.FileHandler(common.CLI_SIGNAL_LOG_PATH, encoding='utf-8',
+                                                                 delay=True)
+    _log_file_handler.setFormatter(logging.Formatter('%(levelname)s : [%(asctime)s] : (%(name)s) : %(message)s'))
+    _log_handler: logging.handlers.MemoryHandler = logging.handlers.MemoryHandler(
+        capacity=common.LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=_log_file_handler
+    )
+    logging.basicConfig(level=common.LOG_LEVEL, handlers=[_log_handler])
     common.LOGGER = logging.getLogger(__name__)
     common.LOGGER.debug("Logging started.")
 
@@ -777,32 +841,32 @@ if __name__ == '__main__':
 
     # Validate / act on arguments:
     arguments.act_on_settings(_args)
+    # The config file is loaded, so the settings dict won't be replaced from here on:
+    _settings: dict[str, Optional[str | bool]] = common.SETTINGS
 
     # Check the signal socket path:
-    if common.SETTINGS['signalSocketPath'] is not None:
-        if (not os.path.exists(common.SETTINGS['signalSocketPath']) or
-                not os.path.isfile(common.SETTINGS['signalSocketPath'])):
+    if _settings['signalSocketPath'] is not None:
+        if not os.path.isfile(_settings['signalSocketPath']):
             out_error("--signalSocketPath must point to an existing socket file.")
             exit(5)
 
     # Check the signal exec path:
-    if common.SETTINGS['signalExecPath'] is not None and (not os.path.exists(common.SETTINGS['signalExecPath']) or
-                                                          not os.path.isfile(common.SETTINGS['signalExecPath'])):
+    if _settings['signalExecPath'] is not None and not os.path.isfile(_settings['signalExecPath']):
         out_error("--signalExecPath must point to an existing signal-cli executable file.")
         exit(6)
 
     # Verify arguments; If --noStartSignal, --signalSocketPath must be defined:
-    if _args.noStartSignal and common.SETTINGS['signalSocketPath'] is None:
+    if _args.noStartSignal and _settings['signalSocketPath'] is None:
         out_error("--signalSocketPath must point to an existing file if using --noStartSignal.")
         exit(7)
 
     # Verify theme is correct:
-    if common.SETTINGS['theme'] not in ('light', 'dark', 'custom'):
+    if _settings['theme'] not in _VALID_THEMES:
         out_error("--theme must be one of: 'light', 'dark', or 'custom'")
         exit(9)
-    if common.SETTINGS['theme'] == 'custom':
+    if _settings['theme'] == 'custom':
         # If there is no theme path, throw an error.
-        if _args.themePath is None and common.SETTINGS['themePath'] is None:
+        if _args.themePath is None and _settings['themePath'] is None:
             out_error("If --theme is 'custom', either --themePath must be supplied, or 'themePath' must be "
                       "defined in your configuration file.")
             exit(10)
@@ -810,7 +874,7 @@ if __name__ == '__main__':
         # elif _args.themePath is not None:
         #     common.SETTINGS['themePath'] = _args.themePath
         # Check that the theme path exists:
-        if not os.path.exists(common.SETTINGS['themePath']) or not os.path.isfile(common.SETTINGS['themePath']):
+        if not os.path.isfile(_settings['themePath']):
             out_error("'themePath' must point to an existing file.")
             exit(11)
 
@@ -820,7 +884,7 @@ if __name__ == '__main__':
     ################################
     # Parse --account:
     if _args.account is not None:
-        common.SETTINGS['defaultAccount'] = _args.account
+        _settings['defaultAccount'] = _args.account
     #################################
     # Parse: --store
     if _args.store:
@@ -831,11 +895,11 @@ if __name__ == '__main__':
             exit(12)
 
     # Make signal-cli config dir if required:
-    if not os.path.exists(common.SETTINGS['signalConfigDir']):
+    if not os.path.isdir(_settings['signalConfigDir']):
         try:
             os.mkdir(common.SIGNAL_CONFIG_DIR, 0o700)
         except (OSError, FileNotFoundError, PermissionError):
-            out_error("Failed to create '%s' directory." % common.SETTINGS['signalConfigDir'])
+            out_error("Failed to create '%s' directory." % _settings['signalConfigDir'])
             exit(13)
     # Check for qr-encode:
     if __find_qrencode__() is None:
@@ -845,11 +909,11 @@ if __name__ == '__main__':
     out_info("Starting signal-cli...", force=True)
     try:
         _signal_cli: SignalCli = SignalCli(
-            signal_config_path=common.SETTINGS['signalConfigDir'],
-            signal_exec_path=common.SETTINGS['signalExecPath'],
+            signal_config_path=_settings['signalConfigDir'],
+            signal_exec_path=_settings['signalExecPath'],
             log_file_path=common.SIGNAL_LOG_PATH,
-            server_address=common.SETTINGS['signalSocketPath'],
-            start_signal=common.SETTINGS['startSignal'],
+            server_address=_settings['signalSocketPath'],
+            start_signal=_settings['startSignal'],
             callback=(signal_start_up_cb, None),
         )
     except FileNotFoundError as _e:
@@ -866,15 +930,15 @@ if __name__ == '__main__':
         exit(18)
 
     # Load the account:
-    if common.SETTINGS['defaultAccount'] is not None:
+    if _settings['defaultAccount'] is not None:
         try:
-            common.CURRENT_ACCOUNT = _signal_cli.accounts.get_by_number(common.SETTINGS['defaultAccount'])
+            common.CURRENT_ACCOUNT = _signal_cli.accounts.get_by_number(_settings['defaultAccount'])
         except ValueError as _e:
             out_error("Invalid account, number not in right format.")
             _signal_cli.stop_signal()
             exit(19)
         if common.CURRENT_ACCOUNT is None:
-            out_error("Account: %s not registered." % common.SETTINGS['defaultAccount'])
+            out_error("Account: %s not registered." % _settings['defaultAccount'])
             _signal_cli.stop_signal()
             exit(20)
     elif len(_signal_cli.accounts) > 0:
@@ -5,7 +5,7 @@ Class to store and manipulate the main window.
 """
 from typing import Optional, Callable, Any
 import curses
-from common import ROW, COL, HEIGHT, WIDTH, STRINGS, MIN_SIZE, Focus
+from common import HEIGHT, WIDTH, STRINGS, MIN_SIZE, Focus
 from cursesFunctions import calc_attributes, center_string
 from themes import ThemeColours
 from window import Window
@@ -71,6 +71,8 @@ class MainWindow(Window):
                         )
 
         self.always_visible = True
+        self.is_dirty: bool = True
+        """True if the windows need to be redrawn."""
         # Store the std_screen:
         self._std_screen: curses.window = std_screen
         """The standard curses screen."""
@@ -96,6 +98,8 @@ class MainWindow(Window):
         """The width of the status bar."""
         self.status_top_left: tuple[int, int] = (-1, -1)
         """The top let of the status bar."""
+        self._geometry: Optional[tuple[tuple[int, int], tuple[int, int]]] = None
+        """The (size, top_left) the window sizes were last calculated for."""
         self.__recalculate_window_sizes__()
 
         # Create primary window objects:
@@ -129,50 +133,62 @@ class MainWindow(Window):
         """The version window."""
         self.sub_windows: tuple[Window, ...] = (self.quit_window, self.link_window, self.qr_window, self.ver_window)
         """The sub windows."""
+        self._draw_order: tuple[Window | MenuBar | StatusBar, ...] = self.primary_windows + self.bars
+        """The order to draw the child windows in, the visible sub-window is drawn after these."""
 
         # The size error message:
         self._error_message: str = STRINGS['messages']['sizeError'].format(rows=MIN_SIZE[HEIGHT], cols=MIN_SIZE[WIDTH])
         self._error_attrs: int = calc_attributes(ThemeColours.MAIN_WIN_ERROR_TEXT, theme['mainWinErrorText'])
+        self._last_error_size: Optional[tuple[int, int]] = None
+        """The terminal size the size error message was last drawn for."""
         return
 
 ###############################################
 # Internal Methods:
 ###############################################
-    def __recalculate_window_sizes__(self):
+    def __recalculate_window_sizes__(self) -> bool:
         """
-        Recalculate the window sizes.
-        :return: None
+        Recalculate the window sizes, if the main window geometry has changed.
+        :return: bool: True the sizes were recalculated, False the geometry is unchanged.
         """
+        geometry: tuple[tuple[int, int], tuple[int, int]] = (self.size, self.top_left)
+        if geometry == self._geometry:
+            return False
+        self._geometry = geometry
+        # Unpack the main window geometry once:
+        height, width = self.size
+        top, left = self.top_left
+        contacts_width: int = (width * 33) // 100
+        messages_height: int = (height * 3) // 4 - 1
+        messages_width: int = width - contacts_width
+        messages_left: int = left + contacts_width
         # Contacts Window
-        self.contacts_size = (self.size[HEIGHT] - 2,
-                              int(self.size[WIDTH] * 0.33))
-        self.contacts_top_left = (self.top_left[ROW] + 1,
-                                  self.top_left[COL])
+        self.contacts_size = (height - 2, contacts_width)
+        self.contacts_top_left = (top + 1, left)
         # Messages window:
-        self.messages_size = (int(self.size[HEIGHT] * 0.75) - 1,
-                              self.size[WIDTH] - self.contacts_size[WIDTH])
-        self.messages_top_left = (self.top_left[ROW] + 1,
-                                  self.top_left[COL] + self.contacts_size[WIDTH])
+        self.messages_size = (messages_height, messages_width)
+        self.messages_top_left = (top + 1, messages_left)
         # Typing window:
-        self.typing_size = (self.size[HEIGHT] - self.messages_size[HEIGHT] - 2,
-                            self.size[WIDTH] - self.contacts_size[WIDTH])
-        self.typing_top_left = (self.messages_top_left[ROW] + self.messages_size[HEIGHT],
-                                self.top_left[COL] + self.contacts_size[WIDTH])
+        self.typing_size = (height - messages_height - 2, messages_width)
+        self.typing_top_left = (top + 1 + messages_height, messages_left)
         # menu bar:
-        self.menu_top_left = (self.top_left[ROW],
-                              self.top_left[COL])
+        self.menu_top_left = (top, left)
         # Status bar:
-        self.status_top_left = (self.bottom_right[ROW],
-                                self.top_left[COL])
-        return
+        self.status_top_left = (self.bottom, left)
+        return True
 
     def __draw_size_error__(self) -> None:
+        # The message is already on the screen for this size:
+        if self.real_size == self._last_error_size:
+            return
+        self._last_error_size = self.real_size
         self._std_screen.clear()
         row: int = int(self.size[HEIGHT] / 2)
         try:
             center_string(self._std_screen, row, self._error_message, self._error_attrs)
         except curses.error:
             pass
+        self._std_screen.noutrefresh()
         curses.doupdate()
         return
 
@@ -182,11 +198,19 @@ class MainWindow(Window):
     def resize(self) -> None:
         size: tuple[int, int] = self._std_screen.getmaxyx()
         top_left: tuple[int, int] = (0, 0)
+        self.is_dirty = True
+        # Spurious resize events, the layout is already correct for this size, just redraw:
+        if size == self.real_size and self._geometry is not None:
+            return
         super().resize(size, top_left, False, False)
         if self.real_size[HEIGHT] < MIN_SIZE[HEIGHT] or self.real_size[WIDTH] < MIN_SIZE[WIDTH]:
+            # Curses may have clipped the child windows, so force a full resize once the terminal is big enough:
+            self._geometry = None
             return
 
-        self.__recalculate_window_sizes__()
+        # Nothing to do if the geometry hasn't changed:
+        if not self.__recalculate_window_sizes__():
+            return
         self.contacts_window.resize(self.contacts_size, self.contacts_top_left)
         self.messages_window.resize(self.messages_size, self.messages_top_left)
         self.typing_window.resize(self.typing_size, self.typing_top_left)
@@ -207,28 +231,29 @@ class MainWindow(Window):
         return False
 
     def redraw(self) -> None:
-        if self.should_resize():
-            self.resize()
+        # NOTE: Resizing is driven by curses.KEY_RESIZE in the main loop, curses only updates the screen size when it
+        #  delivers that key, so there is no point polling should_resize() here.
+        # Skip the redraw if nothing has changed, clear the flag before drawing so changes made by other threads
+        #  while drawing aren't lost:
+        if not self.is_dirty:
+            return
+        self.is_dirty = False
         # If the terminal is too small, draw an error message:
         if self.real_size[HEIGHT] < MIN_SIZE[HEIGHT] or self.real_size[WIDTH] < MIN_SIZE[WIDTH]:
             self.__draw_size_error__()
             return
+        self._last_error_size = None
 
         # Draw main border and title:
         super().redraw()
 
-        # Draw the main windows:
-        self.contacts_window.redraw()
-        self.messages_window.redraw()
-        self.typing_window.redraw()
-        # Draw the menu and status bars:
-        self.menu_bar.redraw()
-        self.status_bar.redraw()
-        # Draw the sub-windows last, only one should be visible at a time.
-        self.link_window.redraw()
-        self.qr_window.redraw()
-        self.ver_window.redraw()
-        self.quit_window.redraw()
+        # Draw the main windows, and the menu and status bars:
+        for window in self._draw_order:
+            window.redraw()
+        # Draw the sub-window last, only one should be visible at a time:
+        sub_window: Optional[Window] = self.get_visible_sub_window()
+        if sub_window is not None:
+            sub_window.redraw()
         curses.doupdate()
         return
 
@@ -3,28 +3,27 @@
 File: menu.py
 Handle basic menu display and control.
 """
-from typing import Any, Optional
+from typing import Any, Optional, Callable
 import curses
+import functools
 
 import common
-from common import ROW, COL, HEIGHT, WIDTH, KEY_ESC, KEYS_ENTER, KEY_BACKSPACE, TOP, LEFT, BOTTOM, RIGHT
-from cursesFunctions import draw_border_on_win, calc_attributes, get_rel_mouse_pos, get_left_click, \
-    get_left_double_click
+from common import ROW, COL, HEIGHT, WIDTH, KEYS_ENTER, TOP, LEFT, BOTTOM, RIGHT
+from cursesFunctions import draw_border_on_win, calc_attributes, get_rel_mouse_pos, get_left_click
 from menuItem import MenuItem
 from typeError import __type_error__
 from themes import ThemeColours
 
 
-def calc_size(menu_labels) -> tuple[int, int]:
+@functools.lru_cache(maxsize=32)
+def calc_size(menu_labels: tuple[str, ...]) -> tuple[int, int]:
     """
     Calculate the menu size given the menu keys and values.
-    :param menu_labels: The list of the menu labels.
+    :param menu_labels: tuple[str, ...]: The menu labels, a tuple so the result can be cached.
     :return: tuple[int, int]: The size: (ROWS, COLS).
     """
     # Determine size:
-    width: int = 0
-    for label in menu_labels:
-        width = max(width, len(label))
+    width: int = max(map(len, menu_labels), default=0)
     height: int = len(menu_labels)
     return height + 2, width + 2  # Add 2 for a border.
 
@@ -33,6 +32,11 @@ class Menu(object):
     """
     Handle basic menu display and control.
     """
+    __slots__ = ('_window', '_std_screen', '_menu_items', '_accel_map', '_nav_keys', '_border_chars', '_border_attrs',
+                 '_selection', '_last_selection', '_min_selection', '_max_selection', '_is_visible', '_border_kwargs',
+                 '_is_dirty', '_mouse_top', '_mouse_left', '_mouse_bottom', '_mouse_right', 'real_size', 'size',
+                 'real_top_left', 'top_left', 'real_bottom_right', 'bottom_right', 'width', 'height', 'top', 'left',
+                 'bottom', 'right')
 ########################################
 # Initialize:
 ########################################
@@ -62,8 +66,12 @@ class Menu(object):
         """The std_screen curses.window object."""
         self._menu_items: list[MenuItem] = menu_items
         """The list of MenuItems for this menu."""
-        self._is_activated: bool = False
-        """Is this menu activated?"""
+        self._accel_map: dict[int, MenuItem] = {char_code: menu_item for menu_item in menu_items
+                                                for char_code in menu_item.char_codes}
+        """The menu items keyed by their accelerator character codes."""
+        self._nav_keys: dict[int, Callable[[], None]] = {curses.KEY_UP: self.dec_selection,
+                                                         curses.KEY_DOWN: self.inc_selection}
+        """The selection methods keyed by their navigation character codes."""
         self._border_chars: dict[str, str] = theme['menuBorderChars']
         """The characters to use for the border."""
         self._border_attrs: int = calc_attributes(ThemeColours.MENU_BORDER, theme['menuBorder'])
@@ -94,6 +102,56 @@ class Menu(object):
         self.bottom_right: tuple[int, int] = (self.top_left[ROW] + self.size[ROW] - 1,
                                               self.top_left[COL] + self.size[COL] - 1)
         """The drawable bottom right corner of this menu."""
+        self.width: int = self.size[WIDTH]
+        """The drawable width of the menu."""
+        self.height: int = self.size[HEIGHT]
+        """The drawable height of the menu."""
+        self.top: int = self.top_left[TOP]
+        """The top most drawable row of the menu."""
+        self.left: int = self.top_left[LEFT]
+        """The left most drawable column of the menu."""
+        self.bottom: int = self.bottom_right[BOTTOM]
+        """The bottom most drawable row of the menu."""
+        self.right: int = self.bottom_right[RIGHT]
+        """The right most drawable column of the menu."""
+        self._mouse_top, self._mouse_left = self.real_top_left
+        """The real top left corner as ints for is_mouse_over(), the menu never moves."""
+        self._mouse_bottom, self._mouse_right = self.real_bottom_right
+        """The real bottom right corner as ints for is_mouse_over()."""
+        self._border_kwargs: dict[str, Any] = {
+            'window': window, 'border_attrs': self._border_attrs, 'ts': self._border_chars['ts'],
+            'bs': self._border_chars['bs'], 'ls': self._border_chars['ls'], 'rs': self._border_chars['rs'],
+            'tl': self._border_chars['tl'], 'tr': self._border_chars['tr'], 'bl': self._border_chars['bl'],
+            'br': self._border_chars['br'], 'size': self.real_size, 'top_left': (0, 0),
+        }
+        """The arguments to draw_border_on_win(), the menu border never changes."""
+        self._is_dirty: bool = True
+        """Does the menu need drawing? When False, redraw() only re-touches the already drawn window."""
+        return
+
+########################################
+# Internal methods:
+########################################
+    def __apply_selection__(self, value: Optional[int]) -> None:
+        """
+        Apply a selection change, without type or range checks.
+        :param value: Optional[int]: The already validated selection, None for nothing selected.
+        :return: None
+        """
+        # Nothing to do if the selection didn't change, i.e. the mouse moved within the selected item:
+        old_selection: Optional[int] = self._selection
+        if value == old_selection:
+            return
+        # Update last selection and selection, the old selection was already validated:
+        self._last_selection = old_selection
+        self._selection = value
+        # Act on selection change:
+        menu_items: list[MenuItem] = self._menu_items
+        if old_selection is not None:
+            menu_items[old_selection].is_selected = False
+        if value is not None:
+            menu_items[value].is_selected = True
+        self._is_dirty = True
         return
 
 ########################################
@@ -104,17 +162,18 @@ class Menu(object):
         Redraw the menu.
         :return: None:
         """
-        if not self.is_visible:
+        if not self._is_visible:
             return
-        # Draw a border:
-        draw_border_on_win(window=self._window, border_attrs=self._border_attrs,
-                           ts=self._border_chars['ts'], bs=self._border_chars['bs'], ls=self._border_chars['ls'],
-                           rs=self._border_chars['rs'], tl=self._border_chars['tl'], tr=self._border_chars['tr'],
-                           bl=self._border_chars['bl'], br=self._border_chars['br'], size=self.real_size,
-                           top_left=(0, 0))
-        # Draw the menu items:
-        for menu_item in self._menu_items:
-            menu_item.redraw()
+        if self._is_dirty:
+            # Draw a border:
+            draw_border_on_win(**self._border_kwargs)
+            # Draw the menu items:
+            for menu_item in self._menu_items:
+                menu_item.redraw()
+            self._is_dirty = False
+        else:
+            # The windows below may have been drawn over the menu, touch it so it's copied back to the screen:
+            self._window.touchwin()
         self._window.noutrefresh()
         return
 
@@ -123,10 +182,9 @@ class Menu(object):
         Increment the selection wrapping if necessary.
         :return: None
         """
-        next_selection = self.selection + 1
-        if next_selection > self._max_selection:
-            next_selection = self._min_selection
-        self.selection = next_selection
+        span: int = self._max_selection - self._min_selection + 1
+        # The wrapped selection is always in range:
+        self.__apply_selection__(self._min_selection + (self._selection - self._min_selection + 1) % span)
         return
 
     def dec_selection(self) -> None:
@@ -134,10 +192,9 @@ class Menu(object):
         Decrement the selection, wrapping if necessary.
         :return: None
         """
-        next_selection: int = self.selection - 1
-        if next_selection < self._min_selection:
-            next_selection = self._max_selection
-        self.selection = next_selection
+        span: int = self._max_selection - self._min_selection + 1
+        # The wrapped selection is always in range:
+        self.__apply_selection__(self._min_selection + (self._selection - self._min_selection - 1) % span)
         return
 
     def process_key(self, char_code: int) -> Optional[bool]:
@@ -148,20 +205,18 @@ class Menu(object):
             not handled and menuBar should handle it.
         """
         # Check that an accelerator was pressed:
-        for menu_item in self._menu_items:
-            if char_code in menu_item.char_codes:
-                self.is_activated = False
-                menu_item.activate()
-                return True
-        if char_code in KEYS_ENTER:
+        menu_item: Optional[MenuItem] = self._accel_map.get(char_code)
+        if menu_item is not None:
             self.is_activated = False
-            self._menu_items[self.selection].activate()
+            menu_item.activate()
             return True
-        elif char_code == curses.KEY_UP:
-            self.dec_selection()
+        if char_code in KEYS_ENTER:
+            self.is_activated = False
+            self._menu_items[self._selection].activate()
             return True
-        elif char_code == curses.KEY_DOWN:
-            self.inc_selection()
+        nav_method: Optional[Callable[[], None]] = self._nav_keys.get(char_code)
+        if nav_method is not None:
+            nav_method()
             return True
         return None
 
@@ -171,10 +226,8 @@ class Menu(object):
         :param mouse_pos: tuple[int, int]: The current mouse position: (ROW, COL).
         :return: bool: True if the mouse is over this menu, False it is not.
         """
-        if self.real_top_left[ROW] <= mouse_pos[ROW] <= self.real_bottom_right[ROW]:
-            if self.real_top_left[COL] <= mouse_pos[COL] <= self.real_bottom_right[COL]:
-                return True
-        return False
+        mouse_row, mouse_col = mouse_pos
+        return self._mouse_top <= mouse_row <= self._mouse_bottom and self._mouse_left <= mouse_col <= self._mouse_right
 
     def process_mouse(self, mouse_pos: tuple[int, int], button_state: int) -> bool:
         """
@@ -186,18 +239,22 @@ class Menu(object):
         # Get the relative mouse position:
         rel_mouse_pos = get_rel_mouse_pos(mouse_pos, self.real_top_left)
 
+        # Find the menu item under the mouse once:
+        for i, menu_item in enumerate(self._menu_items):
+            if menu_item.is_mouse_over(rel_mouse_pos):
+                break
+        else:
+            return False
+
         # Process click:
         if get_left_click(button_state):
-            for i, menu_item in enumerate(self._menu_items):
-                if menu_item.is_mouse_over(rel_mouse_pos):
-                    self.is_activated = False
-                    menu_item.activate()
-                    return True
+            self.is_activated = False
+            menu_item.activate()
+            return True
 
+        # NOTE: Read live, the setting can change while running and nothing would refresh a cached copy.
         if common.SETTINGS['mouseMoveFocus']:
-            for i, menu_item in enumerate(self._menu_items):
-                if menu_item.is_mouse_over(rel_mouse_pos):
-                    self.selection = i
+            self.selection = i
         return False
 
 ########################################
@@ -221,10 +278,11 @@ class Menu(object):
         :raises TypeError: If value is not an int.
         :raises ValueError: If value is out of range.
         """
-        if value is not None and not isinstance(value, int):
-            __type_error__('value', 'Optional[int]', value)
-        elif value is not None and (value < self._min_selection or value > self._max_selection):
-            raise ValueError("'value' out of range: %i->%i" % (self._min_selection, self._max_selection))
+        if __debug__:  # Skipped with python -O.
+            if value is not None and not isinstance(value, int):
+                __type_error__('value', 'Optional[int]', value)
+            elif value is not None and (value < self._min_selection or value > self._max_selection):
+                raise ValueError("'value' out of range: %i->%i" % (self._min_selection, self._max_selection))
         self._last_selection = value
         return
 
@@ -246,20 +304,13 @@ class Menu(object):
         :raises ValueError: If value is out of range defined by self._max_selection and self._min_selection.
         :return: None
         """
-        # Value type and value checks:
-        if value is not None and not isinstance(value, int):
-            __type_error__('value', 'Optional[int]', value)
-        elif value is not None and (value < self._min_selection or value > self._max_selection):
-            raise ValueError("'value' out of range: %i->%i." % (self._min_selection, self._max_selection))
-        # Update last selection:
-        self.last_selection = self._selection
-        # Update selection:
-        self._selection = value
-        # Act on selection change:
-        if self.last_selection is not None:
-            self._menu_items[self.last_selection].is_selected = False
-        if self._selection is not None:
-            self._menu_items[self._selection].is_selected = True
+        # Value type and value checks, skipped with python -O:
+        if __debug__:
+            if value is not None and not isinstance(value, int):
+                __type_error__('value', 'Optional[int]', value)
+            elif value is not None and (value < self._min_selection or value > self._max_selection):
+                raise ValueError("'value' out of range: %i->%i." % (self._min_selection, self._max_selection))
+        self.__apply_selection__(value)
         return
 
     @property
@@ -278,7 +329,7 @@ class Menu(object):
         :param value: bool: The value to set to.
         :return: None.
         """
-        if not isinstance(value, bool):
+        if __debug__ and not isinstance(value, bool):
             __type_error__('value', 'bool', value)
         old_value: bool = self._is_visible
         self._is_visible = value
@@ -286,25 +337,8 @@ class Menu(object):
             self.redraw()
         return
 
-    @property
-    def is_activated(self) -> bool:
-        """
-        Is this menu activated?
-        :return: True if this menu is activated, False if not.
-        """
-        return self._is_visible
-
-    @is_activated.setter
-    def is_activated(self, value: bool) -> None:
-        """
-        Is this menu activated?
-        :param value: bool: True, this window is activated, False if not.
-        :return: None
-        """
-        if not isinstance(value, bool):
-            __type_error__('value', 'bool', value)
-        self.is_visible = value
-        return
+    is_activated = is_visible
+    """Is this menu activated? An alias of is_visible, an activated menu is a visible menu."""
 
     @property
     def std_screen(self) -> curses.window:
@@ -313,51 +347,3 @@ class Menu(object):
         :return: curses.window: The std screen.
         """
         return self._std_screen
-
-    @property
-    def width(self) -> int:
-        """
-        The drawable width of the window.
-        :return: int: The drawable width.
-        """
-        return self.size[WIDTH]
-
-    @property
-    def height(self) -> int:
-        """
-        The drawable height of the window.
-        :return: int: The drawable height.
-        """
-        return self.size[HEIGHT]
-
-    @property
-    def top(self) -> int:
-        """
-        The top most drawable row of the window.
-        :return: int: The top row.
-        """
-        return self.top_left[TOP]
-
-    @property
-    def left(self) -> int:
-        """
-        The left most drawable column of the window.
-        :return: int: The left column.
-        """
-        return self.top_left[LEFT]
-
-    @property
-    def bottom(self) -> int:
-        """
-        The bottom most row of the drawable window.
-        :return: int: The bottom row.
-        """
-        return self.bottom_right[BOTTOM]
-
-    @property
-    def right(self) -> int:
-        """
-        The right most column of the drawable window.
-        :return: int: The right column.
-        """
-        return self.bottom_right[RIGHT]
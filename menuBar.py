@@ -3,8 +3,7 @@
 File: menuBar.py
 Maintain and handle a curses menu bar.
 """
-import time
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Final
 from enum import IntEnum
 import curses
 
@@ -21,11 +20,25 @@ from fileMenu import FileMenu
 from accountsMenu import AccountsMenu
 from helpMenu import HelpMenu
 
+_NEXT_SELECTIONS: Final[tuple[MenuBarSelections, ...]] = (MenuBarSelections.ACCOUNTS, MenuBarSelections.HELP,
+                                                           MenuBarSelections.FILE)
+"""The next selection, indexed by the current selection, wrapping from HELP to FILE."""
+_PREV_SELECTIONS: Final[tuple[MenuBarSelections, ...]] = (MenuBarSelections.HELP, MenuBarSelections.FILE,
+                                                           MenuBarSelections.ACCOUNTS)
+"""The previous selection, indexed by the current selection, wrapping from FILE to HELP."""
+_MENU_SPECS: Final[tuple[tuple[str, type[Menu], int], ...]] = (('file', FileMenu, curses.KEY_F1),
+                                                              ('accounts', AccountsMenu, curses.KEY_F2),
+                                                              ('help', HelpMenu, curses.KEY_F3))
+"""The menu bar items in MenuBarSelections order: (label and callbacks key, menu class, activate char code)."""
+
 
 class MenuBar(Bar):
     """
     Maintain and handle a curses menu bar.
     """
+    __slots__ = ('_acct_label_attrs', '_acct_text_attrs', '_selection', '_last_selection', '_acct_label',
+                 'menu_bar_items', '_key_methods', '_is_dirty', '_drawn_account', '_damaged_items',
+                 '_can_redraw_items')
 
     def __init__(self,
                  std_screen: curses.window,
@@ -43,14 +56,7 @@ class MenuBar(Bar):
         # Set attributes:
         empty_attrs: int = calc_attributes(ThemeColours.MENU_BAR_EMPTY, theme['menuBarBG'])
         bg_char: str = theme['backgroundChars']['menuBar']
-        sel_attrs: int = calc_attributes(ThemeColours.MENU_BAR_SEL, theme['menuBarSel'])
-        sel_accel_attrs: int = calc_attributes(ThemeColours.MENU_BAR_SEL_ACCEL, theme['menuBarSelAccel'])
-        unsel_attrs: int = calc_attributes(ThemeColours.MENU_BAR_UNSEL, theme['menuBarUnsel'])
-        unsel_accel_attrs: int = calc_attributes(ThemeColours.MENU_BAR_UNSEL_ACCEL, theme['menuBarUnselAccel'])
-        sel_lead_indicator: str = theme['menuBarSelChars']['leadSel']
-        sel_tail_indicator: str = theme['menuBarSelChars']['tailSel']
-        unsel_lead_indicator: str = theme['menuBarSelChars']['leadUnsel']
-        unsel_tail_indicator: str = theme['menuBarSelChars']['tailUnsel']
+        # NOTE: The item attributes and indicators are read from the theme by each MenuBarItem.
 
         # Run super:
         Bar.__init__(self, std_screen, top_left[ROW], empty_attrs, bg_char, Focus.MENU_BAR)
@@ -66,71 +72,95 @@ class MenuBar(Bar):
         """What was last selected."""
         self._acct_label = STRINGS['menuBar']['accountLabel']
         """The account label."""
+        self._is_dirty: bool = True
+        """Does the bar need drawing? When False, redraw() only re-touches the already drawn window."""
+        self._drawn_account: Optional[str] = None
+        """The account shown when the bar was last drawn."""
+        self._damaged_items: set[int] = set()
+        """Indexes of the menu bar items to draw again on the next redraw()."""
+        sel_chars: dict[str, str] = theme['menuBarSelChars']
+        self._can_redraw_items: bool = (len(sel_chars['leadSel']) == len(sel_chars['leadUnsel']) and
+                                        len(sel_chars['tailSel']) == len(sel_chars['tailUnsel']))
+        """Can an item be drawn over itself? Only if it's the same width selected and unselected."""
 
         # Build the menu items:
         labels: dict[str, str] = STRINGS['mainMenuNames']
-        # # File menu:
-        file_menu_item_top_left: tuple[int, int] = (self.top_left[ROW], self.top_left[COL] + 1)
-        file_menu_top_left: tuple[int, int] = (self.real_top_left[ROW] + 1, self.real_top_left[COL] + 1)
-        file_menu: FileMenu = FileMenu(std_screen=self._std_screen,
-                                       top_left=file_menu_top_left,
-                                       theme=theme,
-                                       callbacks=callbacks['file'],
-                                       )
-        file_menu_item = MenuBarItem(std_screen=self._std_screen,
-                                     window=self._window,
-                                     top_left=file_menu_item_top_left,
-                                     label=labels['file'],
-                                     theme=theme,
-                                     menu=file_menu,
-                                     activate_char_codes=(curses.KEY_F1, ),
-                                     deactivate_char_codes=(KEY_ESC, KEY_BACKSPACE)
-                                     )
-        # # Accounts menu:
-        acct_menu_item_top_left: tuple[int, int] = (self.top_left[ROW],
-                                                    file_menu_item.top_left[COL] + file_menu_item.width + 1)
-        acct_menu_top_left: tuple[int, int] = (self.real_top_left[ROW] + 1,
-                                               file_menu_item.top_left[COL] + file_menu_item.width + 1)
-        acct_menu = AccountsMenu(std_screen=self._std_screen,
-                                 top_left=acct_menu_top_left,
-                                 theme=theme,
-                                 callbacks=callbacks['accounts']
-                                 )
-        acct_menu_item = MenuBarItem(std_screen=self._std_screen,
-                                     window=self._window,
-                                     top_left=acct_menu_item_top_left,
-                                     label=labels['accounts'],
-                                     theme=theme,
-                                     menu=acct_menu,
-                                     activate_char_codes=(curses.KEY_F2, ),
-                                     deactivate_char_codes=(KEY_ESC, KEY_BACKSPACE),
-                                     )
-        # # Help menu:
-        help_menu_item_top_left: tuple[int, int] = (self.top_left[ROW],
-                                                    acct_menu_item_top_left[COL] + acct_menu_item.width + 1)
-        help_menu_top_left: tuple[int, int] = (top_left[ROW] + 1,
-                                               acct_menu_item_top_left[COL] + acct_menu_item.width + 1)
-        help_menu: HelpMenu = HelpMenu(std_screen=self._std_screen,
-                                       top_left=help_menu_top_left,
-                                       theme=theme,
-                                       callbacks=callbacks['help']
-                                       )
-        help_menu_item = MenuBarItem(std_screen=self._std_screen,
-                                     window=self._window,
-                                     top_left=help_menu_item_top_left,
-                                     label=labels['help'],
-                                     theme=theme,
-                                     menu=help_menu,
-                                     activate_char_codes=(curses.KEY_F3, ),
-                                     deactivate_char_codes=(KEY_ESC, KEY_BACKSPACE)
-                                     )
-
-        # # Build the menu item list:
-        self.menu_bar_items: list[MenuBarItem] = [file_menu_item, acct_menu_item, help_menu_item]
-        """The menu bar item list."""
+        item_kwargs: dict[str, Any] = {'std_screen': self._std_screen, 'window': self._window, 'theme': theme,
+                                       'deactivate_char_codes': (KEY_ESC, KEY_BACKSPACE)}
+        menu_bar_items: list[MenuBarItem] = []
+        # Lay the items out left to right, each menu opens below its menu bar item:
+        item_col: int = self.top_left[COL] + 1
+        menu_col: int = self.real_top_left[COL] + 1
+        for key, menu_class, activate_char_code in _MENU_SPECS:
+            menu: Menu = menu_class(std_screen=self._std_screen,
+                                    top_left=(self.real_top_left[ROW] + 1, menu_col),
+                                    theme=theme,
+                                    callbacks=callbacks[key],
+                                    )
+            menu_bar_item = MenuBarItem(top_left=(self.top_left[ROW], item_col),
+                                        label=labels[key],
+                                        menu=menu,
+                                        activate_char_codes=(activate_char_code, ),
+                                        **item_kwargs
+                                        )
+            menu_bar_items.append(menu_bar_item)
+            item_col += menu_bar_item.width + 1
+            menu_col = item_col  # Later menus open at their item's column in the bar.
+        self.menu_bar_items: tuple[MenuBarItem, ...] = tuple(menu_bar_items)
+        """The menu bar items, indexed by MenuBarSelections, fixed after construction."""
+        self._key_methods: dict[int, Callable[[], None]] = {curses.KEY_LEFT: self.dec_selection,
+                                                            curses.KEY_RIGHT: self.inc_selection}
+        """The methods to run when focused, keyed by character code."""
+        self._key_methods.update(dict.fromkeys(KEYS_ENTER, self.activate_selection))
+
+        return
+
+    ######################################
+    # Internal methods:
+    ######################################
+    def __apply_selection__(self, value: Optional[MenuBarSelections | int]) -> None:
+        """
+        Apply a selection change, without type or range checks.
+        :param value: Optional[MenuBarSelections | int]: The already validated selection, None for nothing selected.
+        :return: None
+        """
+        # Nothing to do if the selection didn't change, i.e. clicking the selected item:
+        old_selection: Optional[MenuBarSelections] = self._selection
+        if value == old_selection:
+            return
+
+        # Set whether we should deactivate / activate the menus when changing selections:
+        reactivate_menu: bool = False
+        if old_selection is not None:
+            reactivate_menu = self.menu_bar_items[old_selection].is_activated
 
+        # Store the last selection:
+        self._last_selection = old_selection
+
+        # Set the value, only converting plain ints to the enum:
+        if value is None or isinstance(value, MenuBarSelections):
+            self._selection = value
+        else:
+            self._selection = MenuBarSelections(value)
+
+        # Set / Clear the selection bool, and activated state.:
+        if self._can_redraw_items:
+            self._damaged_items.update(i for i in (value, old_selection) if i is not None)
+        else:
+            self._is_dirty = True
+        if value is not None:
+            if reactivate_menu:
+                self.menu_bar_items[value].is_activated = True
+            self.menu_bar_items[value].is_selected = True
+        if old_selection is not None:
+            if reactivate_menu:
+                self.menu_bar_items[old_selection].is_activated = False
+            self.menu_bar_items[old_selection].is_selected = False
         return
 
+    ######################################
+    # Methods:
+    ######################################
     def redraw(self) -> None:
         """
         Redraw the menu bar.
@@ -139,22 +169,57 @@ class MenuBar(Bar):
         # Return if not visible:
         if not self.is_visible:
             return
+        window: curses.window = self._window
+        current_account: str = str(common.CURRENT_ACCOUNT)
+        # At most the selection changed, so draw just the damaged items and let the menus draw themselves, touching
+        # the window so it's copied to the screen again:
+        damaged_items: set[int] = self._damaged_items
+        if not self._is_dirty and current_account == self._drawn_account:
+            window.touchwin()
+            for i, menu_bar_item in enumerate(self.menu_bar_items):
+                if i in damaged_items:
+                    menu_bar_item.redraw()
+                else:
+                    menu_bar_item.menu.redraw()
+            damaged_items.clear()
+            window.noutrefresh()
+            return
+        self._is_dirty = False
+        damaged_items.clear()
+        self._drawn_account = current_account
         # Draw background:
         super().redraw()
         # Draw the menu bar items:
         for menu_bar_item in self.menu_bar_items:
             menu_bar_item.redraw()
         # Draw the current account info:
-        _, num_cols = self._window.getmaxyx()
-        current_account: str = str(common.CURRENT_ACCOUNT)
+        _, num_cols = window.getmaxyx()
         total_len = len(self._acct_label) + len(current_account)
         acct_col = (num_cols - 1) - total_len - 1
-        self._window.move(0, acct_col)
-        add_str(self._window, self._acct_label + ':', self._acct_label_attrs)
-        add_str(self._window, current_account, self._acct_text_attrs)
+        window.move(0, acct_col)
+        add_str(window, self._acct_label + ':', self._acct_label_attrs)
+        add_str(window, current_account, self._acct_text_attrs)
 
         # Refresh the window:
-        self._window.noutrefresh()
+        window.noutrefresh()
+        return
+
+    def resize(self, top_left: tuple[int, int]) -> None:
+        """
+        Resize the menu bar, the resized window has to be drawn again.
+        :param top_left: tuple[int, int]: The new top left corner.
+        :return: None
+        """
+        super().resize(top_left)
+        self._is_dirty = True
+        return
+
+    def activate_selection(self) -> None:
+        """
+        Activate the selected menu, the focused menu bar always has a selection.
+        :return: None
+        """
+        self.menu_bar_items[self._selection].is_activated = True
         return
 
     def inc_selection(self) -> None:
@@ -162,10 +227,8 @@ class MenuBar(Bar):
         Increment the selection, wrapping if necessary.
         :return: None
         """
-        next_selection = int(self.selection) + 1
-        if next_selection > MenuBarSelections.HELP:
-            next_selection = MenuBarSelections.FILE
-        self.selection = MenuBarSelections(next_selection)
+        # The next selection is always in range:
+        self.__apply_selection__(_NEXT_SELECTIONS[self._selection])
         return
 
     def dec_selection(self) -> None:
@@ -173,11 +236,8 @@ class MenuBar(Bar):
         Decrement the selection wrapping if necessary.
         :return: None
         """
-        # Make sure the selected item is not activated any more:
-        next_selection = int(self.selection) - 1
-        if next_selection < MenuBarSelections.FILE:
-            next_selection = MenuBarSelections.HELP
-        self.selection = MenuBarSelections(next_selection)
+        # The previous selection is always in range:
+        self.__apply_selection__(_PREV_SELECTIONS[self._selection])
         return
 
     def process_key(self, char_code: int) -> Optional[bool]:
@@ -199,24 +259,18 @@ class MenuBar(Bar):
 
         # Process the rest of the keys, only if we're focused since this is run every key press.
         if self.is_focused:
-            # Pass the key code to the active menu before processing:
+            # Pass the key code to the active menu before processing, finding the active menu once:
             return_value: Optional[bool] = None
-            if self.is_menu_activated:
-                return_value = self.active_menu.process_key(char_code)
+            active_menu: Optional[Menu] = self.active_menu
+            if active_menu is not None:
+                return_value = active_menu.process_key(char_code)
                 if return_value is not None:
                     return return_value
 
-            # Handle Enter:
-            if char_code in KEYS_ENTER:
-                self.selected_menu_bar_item.is_activated = True
-                return True
-            # Handle KEY LEFT:
-            elif char_code == curses.KEY_LEFT:
-                self.dec_selection()
-                return True
-            # Handle KEY RIGHT
-            elif char_code == curses.KEY_RIGHT:
-                self.inc_selection()
+            # Handle Enter, KEY LEFT and KEY RIGHT:
+            key_method: Optional[Callable[[], None]] = self._key_methods.get(char_code)
+            if key_method is not None:
+                key_method()
                 return True
         # Character wasn't handled:
         return None
@@ -232,8 +286,9 @@ class MenuBar(Bar):
         """
         return_value: Optional[bool]
         # If a menu is active, pass the mouse there:
-        if self.is_menu_activated and self.active_menu.is_mouse_over(mouse_pos):
-            return_value = self.active_menu.process_mouse(mouse_pos, button_state)
+        active_menu: Optional[Menu] = self.active_menu
+        if active_menu is not None and active_menu.is_mouse_over(mouse_pos):
+            return_value = active_menu.process_mouse(mouse_pos, button_state)
             if return_value is not None:
                 return return_value
 
@@ -266,8 +321,9 @@ class MenuBar(Bar):
         if return_value is True:
             return True
 
-        if self.is_menu_activated:
-            return_value = self.active_menu.is_mouse_over(mouse_pos)
+        active_menu: Optional[Menu] = self.active_menu
+        if active_menu is not None:
+            return_value = active_menu.is_mouse_over(mouse_pos)
             if return_value is True:
                 return True
         return False
@@ -300,37 +356,14 @@ class MenuBar(Bar):
         :raises ValueError: If value is out of range.
         :return: None
         """
-        # Value and type check:
-        if value is not None:
-            if not isinstance(value, (MenuBarSelections, int)):
+        # Value and type check, MenuBarSelections are ints, skipped with python -O:
+        if __debug__ and value is not None:
+            if not isinstance(value, int):
                 __type_error__("value", "Optional[Selections | int]", value)
-            elif value < MenuBarSelections.FILE or value > MenuBarSelections.HELP:
+            elif not MenuBarSelections.FILE <= value <= MenuBarSelections.HELP:
                 raise ValueError("value out of range. See MenuSelections enum for range.")
 
-        # Set whether we should deactivate / activate the menus when changing selections:
-        reactivate_menu: bool = False
-        if self._selection is not None:
-            reactivate_menu = self.menu_bar_items[self._selection].is_activated
-
-        # Store the last selection:
-        self._last_selection = self._selection
-
-        # Set the value:
-        if value is not None:
-            self._selection = MenuBarSelections(value)
-        else:
-            self._selection = None
-
-        # Set / Clear the selection bool, and activated state.:
-        if self._selection != self.last_selection:
-            if self._selection is not None:
-                if reactivate_menu:
-                    self.menu_bar_items[self._selection].is_activated = True
-                self.menu_bar_items[self._selection].is_selected = True
-            if self._last_selection is not None:
-                if reactivate_menu:
-                    self.menu_bar_items[self._last_selection].is_activated = False
-                self.menu_bar_items[self._last_selection].is_selected = False
+        self.__apply_selection__(value)
         return
 
     @property
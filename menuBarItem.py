@@ -17,6 +17,10 @@ class MenuBarItem(object):
     """
     Class to hold a single menu item.
     """
+    __slots__ = ('_std_screen', '_window', '_sel_attrs', '_sel_accel_attrs', '_unsel_attrs', '_unsel_accel_attrs',
+                 '_sel_lead_indicator', '_sel_tail_indicator', '_unsel_lead_indicator', '_unsel_tail_indicator',
+                 '_is_selected', '_menu', '_mouse_row', '_mouse_left', '_mouse_right', 'top_left', 'size',
+                 'bottom_right', 'label', 'activate_char_codes', 'deactivate_char_codes')
 
 #################################
 # Initialize:
@@ -57,13 +61,14 @@ class MenuBarItem(object):
         """The attributes to use when this item is unselected."""
         self._unsel_accel_attrs: int = calc_attributes(ThemeColours.MENU_BAR_UNSEL_ACCEL, theme['menuBarUnselAccel'])
         """The attributes to use for the accelerator when item is unselected."""
-        self._sel_lead_indicator: str = theme['menuBarSelChars']['leadSel']
+        sel_chars: dict[str, str] = theme['menuBarSelChars']
+        self._sel_lead_indicator: str = sel_chars['leadSel']
         """The string to append to the beginning of the label when selected."""
-        self._sel_tail_indicator: str = theme['menuBarSelChars']['tailSel']
+        self._sel_tail_indicator: str = sel_chars['tailSel']
         """The string to append to the end of the label when selected."""
-        self._unsel_lead_indicator: str = theme['menuBarSelChars']['leadUnsel']
+        self._unsel_lead_indicator: str = sel_chars['leadUnsel']
         """The string to append to the beginning of the label when unselected."""
-        self._unsel_tail_indicator: str = theme['menuBarSelChars']['tailUnsel']
+        self._unsel_tail_indicator: str = sel_chars['tailUnsel']
         """The string to append to the end of the label when unselected."""
         self._is_selected: bool = False
         """If this item is selected."""
@@ -80,10 +85,18 @@ class MenuBarItem(object):
         """The bottom right of this menu item."""
         self.label: str = label
         """The label to display."""
-        self.activate_char_codes: tuple[int] = (*activate_char_codes,)
+        self.activate_char_codes: frozenset[int] = frozenset(activate_char_codes)
         """Character codes that activate this menu."""
-        self.deactivate_char_codes: tuple[int] = (*deactivate_char_codes,)
+        self.deactivate_char_codes: frozenset[int] = frozenset(deactivate_char_codes)
         """Character codes that deactivate this menu."""
+
+        # Mouse bounds, the item never moves:
+        self._mouse_row: int = self.top_left[ROW]
+        """The row the mouse must be on to be over this item."""
+        self._mouse_left: int = self.top_left[COL]
+        """The left most column the mouse can be over this item."""
+        self._mouse_right: int = self.bottom_right[COL]
+        """The right most column the mouse can be over this item."""
         return
 
 #################################
@@ -122,8 +135,7 @@ class MenuBarItem(object):
         self._window.addstr(tail_indicator, text_attrs)
         # Redraw the menu:
         self._menu.redraw()
-        # Refresh the window:
-        self._window.noutrefresh()
+        # NOTE: The menu bar refreshes its window once after drawing all of its items.
         return
 
     def is_mouse_over(self, rel_mouse_pos: tuple[int, int]) -> bool:
@@ -132,10 +144,8 @@ class MenuBarItem(object):
         :param rel_mouse_pos: tuple[int, int]: The relative mouse position: (ROW, COL).
         :return: bool: True if the mouse is over this menu bar item, False it is not.
         """
-        if rel_mouse_pos[ROW] == self.top_left[ROW]:
-            if self.top_left[COL] <= rel_mouse_pos[COL] <= self.bottom_right[COL]:
-                return True
-        return False
+        mouse_row, mouse_col = rel_mouse_pos
+        return mouse_row == self._mouse_row and self._mouse_left <= mouse_col <= self._mouse_right
 
     def process_key(self, char_code: int) -> Optional[bool]:
         """
@@ -182,10 +192,8 @@ class MenuBarItem(object):
         """
         if not isinstance(value, bool):
             __type_error__('value', 'bool', value)
-        old_value = self._is_selected
+        # NOTE: MenuBar.__apply_selection__ marks the old and new items damaged, and only those are redrawn.
         self._is_selected = value
-        if value != old_value and value:
-            self.redraw()
         return
 
     @property
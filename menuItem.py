@@ -14,6 +14,10 @@ class MenuItem(object):
     """
     Store an handle a single menu item.
     """
+    __slots__ = ('_std_screen', '_window', '_bg_char', '_bg_line', '_sel_attrs', '_sel_accel_attrs',
+                 '_sel_lead_indicator', '_sel_tail_indicator', '_unsel_attrs', '_unsel_accel_attrs',
+                 '_unsel_lead_indicator', '_unsel_tail_indicator', '_callback', '_is_selected', '_mouse_row',
+                 '_mouse_left', '_mouse_right', 'top_left', 'size', 'bottom_right', 'label', 'char_codes')
 #######################################
 # Initialize:
 #######################################
@@ -45,6 +49,8 @@ class MenuItem(object):
         """The curses window to draw on."""
         self._bg_char: str = theme['backgroundChars']['menuItem']
         """The character to use for drawing the background."""
+        self._bg_line: str = self._bg_char * width
+        """The background of this menu item, the item width never changes."""
         self._sel_attrs: int = calc_attributes(ThemeColours.MENU_SEL, theme['menuSel'])
         """Attributes to use when selected."""
         self._sel_accel_attrs: int = calc_attributes(ThemeColours.MENU_SEL_ACCEL, theme['menuSelAccel'])
@@ -76,8 +82,16 @@ class MenuItem(object):
         """The bottom right of this menu item."""
         self.label: str = label
         """The label with accel indicators."""
-        self.char_codes: list[int] = char_codes
+        self.char_codes: frozenset[int] = frozenset(char_codes)
         """The character codes this menu item should react to."""
+
+        # Mouse bounds, the item never moves:
+        self._mouse_row: int = self.top_left[ROW]
+        """The row the mouse must be on to be over this item."""
+        self._mouse_left: int = self.top_left[COL]
+        """The left most column the mouse can be over this item."""
+        self._mouse_right: int = self.bottom_right[COL]
+        """The right most column the mouse can be over this item."""
         return
 
 #######################################
@@ -108,9 +122,7 @@ class MenuItem(object):
         # Move to start:
         self._window.move(self.top_left[ROW], self.top_left[COL])
         # Draw the background:
-        num_row, num_col = self._window.getmaxyx()
-        for col in range(self.top_left[COL], self.bottom_right[COL] + 1):
-            self._window.addstr(self._bg_char, text_attrs)
+        self._window.addstr(self._bg_line, text_attrs)
         # Move back to the start:
         self._window.move(self.top_left[ROW], self.top_left[COL])
         # Put start selection indicator:
@@ -119,8 +131,7 @@ class MenuItem(object):
         add_accel_text(self._window, self.label, text_attrs, accel_attrs)
         # Put the trailing selection indicator:
         self._window.addstr(tail_indicator, text_attrs)
-        # Update the window:
-        self._window.noutrefresh()
+        # NOTE: The menu refreshes its window once after drawing all of its items.
         return
 
     def activate(self) -> None:
@@ -137,10 +148,8 @@ class MenuItem(object):
         :param rel_mouse_pos: tuple[int, int]: The relative mouse position: (ROW, COL)
         :return: bool: True if the mouse is over this menu item, False it is not.
         """
-        if rel_mouse_pos[ROW] == self.top_left[ROW]:
-            if self.top_left[COL] <= rel_mouse_pos[COL] <= self.bottom_right[COL]:
-                return True
-        return False
+        mouse_row, mouse_col = rel_mouse_pos
+        return mouse_row == self._mouse_row and self._mouse_left <= mouse_col <= self._mouse_right
 
 #######################################
 # Properties:
@@ -162,12 +171,10 @@ class MenuItem(object):
         :return: None
         :raises TypeError: If value is not a bool.
         """
-        if not isinstance(value, bool):
+        if __debug__ and not isinstance(value, bool):  # Skipped with python -O.
             __type_error__('value', 'bool', value)
-        old_value = self._is_selected
+        # NOTE: The menu marks itself dirty when its selection changes, and redraws its items on the next frame.
         self._is_selected = value
-        if old_value != value:
-            self.redraw()
         return
 
     @property
@@ -12,7 +12,7 @@ from SignalCliApi.signalCommon import RecipientTypes
 from SignalCliApi.signalMessage import SignalMessage
 from SignalCliApi.signalMessages import SignalMessages
 from common import ROW, COL, TOP, LEFT, BOTTOM, RIGHT, STRINGS, Focus
-from cursesFunctions import calc_attributes, add_title_to_win, add_ch, center_string, terminal_bell
+from cursesFunctions import calc_attributes, add_title_to_win, add_str, center_string, terminal_bell
 from messageItem import MessageItem
 from themes import ThemeColours
 from typeError import __type_error__
@@ -126,9 +126,9 @@ class MessagesWindow(Window):
         return
 
     def __clear_pad__(self) -> None:
+        bg_line: str = self._bg_char * self.pad_width
         for row in range(0, self.pad_height):
-            for col in range(0, self.pad_width):
-                add_ch(self._pad, self._bg_char, self._bg_attrs, row, col)
+            add_str(self._pad, bg_line, self._bg_attrs, row, 0)
         return
 
     def __create_pad__(self):
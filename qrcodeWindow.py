@@ -68,11 +68,11 @@ class QRCodeWindow(Window):
             return
         super().redraw()
         for i, line in enumerate(self.qrcode):
-            for j, char in enumerate(self.qrcode[i]):
+            for j, char in enumerate(line):
                 if len(char) != 1:
                     logger.debug("Char = %s" % char)
                 self._window.addch(1 + i, 1 + j, char, self._text_attrs)
-        self._window.refresh()
+        self._window.noutrefresh()
         return
 
     def resize(self) -> None:
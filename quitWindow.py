@@ -16,6 +16,11 @@ from themes import ThemeColours
 from typeError import __type_error__
 from window import Window
 
+_CLOSE_KEYS: Final[frozenset[int]] = frozenset((KEY_ESC, KEY_BACKSPACE))
+"""Keys that close the quit window without quitting."""
+_TOGGLE_KEYS: Final[frozenset[int]] = frozenset((curses.KEY_LEFT, curses.KEY_RIGHT))
+"""Keys that toggle between the yes and no buttons."""
+
 
 class QuitWindow(Window):
     """
@@ -155,9 +160,9 @@ class QuitWindow(Window):
                 raise Quit()
             else:
                 return False
-        elif char_code in (KEY_ESC, KEY_BACKSPACE):
+        elif char_code in _CLOSE_KEYS:
             return False
-        elif char_code in (curses.KEY_LEFT, curses.KEY_RIGHT):
+        elif char_code in _TOGGLE_KEYS:
             self.yes_selected = not self.yes_selected
             return True
         return None
@@ -19,6 +19,9 @@ class StatusBar(Bar):
     """
     Maintain and control a status bar.
     """
+    __slots__ = ('_char_code_attrs', '_mouse_attrs', '_receive_attrs', 'receive_started_char', 'receive_stopped_char',
+                 'is_char_code_visible', 'is_mouse_visible', '_char_code', '_mouse_pos', '_mouse_button_state',
+                 '_receive_state')
 
     def __init__(self,
                  std_screen: curses.window,
@@ -116,7 +119,6 @@ class StatusBar(Bar):
         self._char_code = value
         if old_value != value and self.is_visible:
             self.redraw()
-            curses.doupdate()
         return
 
     @property
@@ -147,7 +149,6 @@ class StatusBar(Bar):
         self._mouse_pos = value
         if old_value != value and self.is_visible:
             self.redraw()
-            curses.doupdate()
         return
 
     @property
@@ -172,5 +173,4 @@ class StatusBar(Bar):
         self._mouse_button_state = value
         if old_value != value and self.is_visible:
             self.redraw()
-            curses.doupdate()
         return